@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import os
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -171,45 +172,50 @@ class Student:
             print(f"Failed to send email: {str(e)}")
 
 
-# Example usage
-student = Student("ISHIMWE Bruno", "i.bruno@alustudent.com")
-
-# Creating courses with Formative and Summative assignments
-course_1 = Course("Introduction to Programming and Databases", total_sessions=7)
-course_1.add_assignment(Assignment("Python - Hello, World", 100, 10, 'Formative'))
-course_1.add_assignment(Assignment("Python - Inheritance", 40.59, 20, 'Formative'))
-course_1.add_assignment(Assignment("Python - Data Structures", 100, 30, 'Summative'))
-course_1.mark_attendance("Sep 16", "Present")
-course_1.mark_attendance("Sep 17", "Present")
-course_1.mark_attendance("Sep 18", "Present")
-course_1.mark_attendance("Sep 19", "Present")
-course_1.mark_attendance("Sep 20", "Present")
-course_1.mark_attendance("Sep 21", "Present")
-course_1.mark_attendance("Sep 22", "Present")  # Corrected attendance to 100% for all sessions
-
-course_2 = Course("Self-Leadership and Team Dynamics", total_sessions=7)
-course_2.add_assignment(Assignment("Enneagram Test", 80, 10, 'Formative'))
-course_2.add_assignment(Assignment("Empathy Discussion Board", 65, 20, 'Formative'))
-course_2.add_assignment(Assignment("Community Building Quiz", 90, 20, 'Summative'))
-
-course_3 = Course("Introduction to IT Tools and Linux", total_sessions=10)  # Added new course
-course_3.add_assignment(Assignment("Pre-reading Sunday 1", 90, 10, 'Formative'))
-course_3.add_assignment(Assignment("Discussion Board", 100, 20, 'Formative'))
-course_3.add_assignment(Assignment("In Call Check-in Quiz 1", 65, 15, 'Formative'))
-course_3.add_assignment(Assignment("Pre-reading Sunday 2", 83.33, 15, 'Formative'))
-course_3.add_assignment(Assignment("General Quiz", 75.51, 15, 'Formative'))
-course_3.add_assignment(Assignment("Shell, processes and signals", 100, 25, 'Summative'))
-
-# Adding courses to student
-student.add_course(course_1)
-student.add_course(course_2)
-student.add_course(course_3)
-
-# Print report to terminal
-print(student.generate_report(sort_order="ascending"))
-
-# Optional: Send report to parent's email
-parent_email = "ishimwebruno331@gmail.com"
-sender_email = "i.bruno@alustudent.com"
-app_password = "PRE EDUCA STD PLL"
-student.send_report_to_parent(parent_email, sender_email, app_password)
+def main():
+    # Example usage: (name, total sessions, assignments, attended dates)
+    courses = [
+        ("Introduction to Programming and Databases", 7, [
+            ("Python - Hello, World", 100, 10, 'Formative'),
+            ("Python - Inheritance", 40.59, 20, 'Formative'),
+            ("Python - Data Structures", 100, 30, 'Summative'),
+        ], ["Sep 16", "Sep 17", "Sep 18", "Sep 19", "Sep 20", "Sep 21", "Sep 22"]),
+        ("Self-Leadership and Team Dynamics", 7, [
+            ("Enneagram Test", 80, 10, 'Formative'),
+            ("Empathy Discussion Board", 65, 20, 'Formative'),
+            ("Community Building Quiz", 90, 20, 'Summative'),
+        ], []),
+        ("Introduction to IT Tools and Linux", 10, [
+            ("Pre-reading Sunday 1", 90, 10, 'Formative'),
+            ("Discussion Board", 100, 20, 'Formative'),
+            ("In Call Check-in Quiz 1", 65, 15, 'Formative'),
+            ("Pre-reading Sunday 2", 83.33, 15, 'Formative'),
+            ("General Quiz", 75.51, 15, 'Formative'),
+            ("Shell, processes and signals", 100, 25, 'Summative'),
+        ], []),
+    ]
+
+    student = Student("ISHIMWE Bruno", "i.bruno@alustudent.com")
+    for course_name, total_sessions, assignments, attended in courses:
+        course = Course(course_name, total_sessions)
+        for assignment in assignments:
+            course.add_assignment(Assignment(*assignment))
+        for date in attended:
+            course.mark_attendance(date, "Present")
+        student.add_course(course)
+
+    # Print report to terminal
+    print(student.generate_report(sort_order="ascending"))
+
+    # Optional: Send report to parent's email, with SMTP credentials taken from the environment
+    parent_email = "ishimwebruno331@gmail.com"
+    sender_email = os.environ.get('ALU_SMTP_USER')
+    app_password = os.environ.get('ALU_SMTP_PW')
+    if not (sender_email and app_password):
+        print("Set ALU_SMTP_USER and ALU_SMTP_PW to email the report.")
+        return
+    student.send_report_to_parent(parent_email, sender_email, app_password)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,52 +1,260 @@
 #!/usr/bin/env python3
 
+import os
+import queue
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from tabulate import tabulate  # Ensure tabulate module is installed
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from operator import attrgetter
+
+try:
+    from wcwidth import wcswidth  # Optional: measures wide characters the way tabulate did
+except ImportError:
+    wcswidth = None
+
+# Constant report fragments, built once at import
+_EQ = "=" * 40 + "\n"
+_DASH = "-" * 60 + "\n"
+_PASS_YES = "Passed: Yes\n"
+_PASS_NO = "Passed: No\n"
+_NO_RESUBMISSIONS = "No Resubmissions Needed.\n"
+_ATT_OK = "Attendance is in good standing (100%).\n"
+_ATT_WARN = "Warning: Attendance is below 100%. The student should attend more classes.\n"
+_TRANSCRIPT_TITLE = "\nTranscript Breakdown:\n"
+_DETAIL_TITLE = "\nDetailed Report:\n"
+_TRANSCRIPT_HEADERS = ("Assignment", "Type", "Score (%)", "Weight (%)")
+_DETAIL_HEADERS = ("Course", "Assignment", "Score", "Weight", "Weighted Score")
+
+MAX_SMTP_CONNECTIONS = 15  # Gmail's limit on simultaneous SMTP connections
+_TRANSIENT_SMTP_CODES = (421, 450, 454)  # Temporary failures worth retrying
+
 
 class Assignment:
+    """A graded assignment. Its fields are read-only so the cached weighted score stays correct."""
+
+    __slots__ = ('_name', '_score', '_weight', '_assignment_type', '_weighted')
+
     def __init__(self, name, score, weight, assignment_type):
-        self.name = name
-        self.score = score
-        self.weight = weight
-        self.assignment_type = assignment_type  # 'Formative' or 'Summative'
+        self._name = name
+        self._score = score
+        self._weight = weight
+        self._assignment_type = assignment_type  # 'Formative' or 'Summative'
+        self._weighted = score * weight / 100
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def score(self):
+        return self._score
+
+    @property
+    def weight(self):
+        return self._weight
+
+    @property
+    def assignment_type(self):
+        return self._assignment_type
 
     def get_weighted_score(self):
-        return self.score * self.weight / 100
+        return self._weighted
+
+
+# Everything generate_report needs from a course, collected in a single pass. detail_rows
+# leave out the course name, which the report adds so a renamed course shows its new name.
+CourseSummary = namedtuple('CourseSummary', [
+    'formative_weight', 'formative_score', 'summative_weight', 'summative_score',
+    'total_weight', 'total_weighted_score', 'resubmissions', 'transcript_rows', 'detail_rows',
+])
+
+
+def _text_width(text):
+    """Terminal columns taken by text, counting wide (CJK, emoji) characters as two when wcwidth is installed."""
+    if text.isascii() or wcswidth is None:
+        return len(text)
+    width = wcswidth(text)
+    return width if width >= 0 else len(text)
+
+
+def _iter_grid(headers, rows):
+    """Yield a grid table of string cells, laid out like tabulate's "grid" format.
+
+    Cells are stripped of surrounding whitespace and may span several lines. Unlike
+    tabulate, cells are never parsed as numbers: every column is left-aligned and
+    printed as written, so a column of names such as "123", "-7" or "1e3" is not
+    right-aligned or reformatted.
+    """
+    headers = [header.split("\n") for header in headers]
+    rows = [[cell.strip().split("\n") for cell in row] for row in rows]
+    widths = [max(map(_text_width, lines)) + 2 for lines in headers]
+    for row in rows:
+        for i, lines in enumerate(row):
+            width = max(map(_text_width, lines))
+            if width > widths[i]:
+                widths[i] = width
+
+    sep = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+
+    def render_line(texts):
+        return "\n| " + " | ".join(text + " " * (width - _text_width(text))
+                                    for text, width in zip(texts, widths)) + " |"
+
+    def render(cells):
+        height = max(map(len, cells))
+        if height == 1:
+            return render_line([lines[0] for lines in cells]) + "\n"
+        return "".join(render_line([lines[k] if k < len(lines) else "" for lines in cells])
+                       for k in range(height)) + "\n"
+
+    yield sep
+    yield render(headers)
+    yield sep.replace("-", "=")
+    for row in rows:
+        yield render(row)
+        yield sep
+    if not rows:
+        yield "\n"
+        yield sep
 
 
 class Course:
+    __slots__ = ('name', '_assignments', '_attendance', 'total_sessions', '_present_count',
+                 '_weights', '_weighted_scores', '_types', '_dirty', '_summary', '_summaries', '_orders')
+
     def __init__(self, name, total_sessions):
         self.name = name
-        self.assignments = []  # A list of assignments
-        self.attendance = []  # Track attendance as a list of tuples (date, status)
+        self._assignments = []  # A list of assignments
+        self._attendance = []  # Track attendance as a list of tuples (date, status)
         self.total_sessions = total_sessions  # Total mandatory sessions in the course
+        self._present_count = 0  # Running count of 'Present' sessions
+        # Parallel per-assignment columns so aggregations avoid attribute lookups
+        self._weights = []
+        self._weighted_scores = []
+        self._types = []
+        # Cached until an assignment is added: the order-independent summary, plus the
+        # per-sort-order summaries and assignment index orders derived from it
+        self._dirty = True
+        self._summary = None
+        self._summaries = {}
+        self._orders = {}
+
+    @property
+    def assignments(self):
+        """Read-only view of the assignments; use add_assignment to add one."""
+        return tuple(self._assignments)
 
     def add_assignment(self, assignment):
-        self.assignments.append(assignment)
+        self._assignments.append(assignment)
+        self._weights.append(assignment.weight)
+        self._weighted_scores.append(assignment.get_weighted_score())
+        self._types.append(assignment.assignment_type)
+        self._dirty = True
+
+    @property
+    def attendance(self):
+        """Read-only view of the (date, status) records; use mark_attendance to add one."""
+        return tuple(self._attendance)
 
     def mark_attendance(self, date, status):
         """Mark attendance for a specific session."""
-        self.attendance.append((date, status))
+        self._attendance.append((date, status))
+        if status == 'Present':
+            self._present_count += 1
 
     def calculate_attendance(self):
         """Calculate attendance percentage."""
-        total_present = sum(1 for _, status in self.attendance if status == 'Present')
-        return (total_present / self.total_sessions) * 100
+        return (self._present_count / self.total_sessions) * 100
+
+    def calculate_totals(self):
+        """Total weight and weighted score across every assignment in the course."""
+        return sum(self._weights), sum(self._weighted_scores)
 
     def calculate_group_score(self, group_type):
-        total_weight = 0
-        total_weighted_score = 0
-        for assignment in self.assignments:
-            if assignment.assignment_type == group_type:
-                total_weight += assignment.weight
-                total_weighted_score += assignment.get_weighted_score()
+        total_weight = total_weighted_score = 0
+        for weight, weighted_score, assignment_type in zip(self._weights, self._weighted_scores, self._types):
+            if assignment_type == group_type:
+                total_weight += weight
+                total_weighted_score += weighted_score
         return total_weight, total_weighted_score
 
-    def check_progression(self):
-        formative_weight, formative_score = self.calculate_group_score('Formative')
-        summative_weight, summative_score = self.calculate_group_score('Summative')
+    def _refresh_cache(self):
+        """Drop cached summaries and orders if assignments changed since they were built."""
+        if self._dirty:
+            self._summary = None
+            self._summaries.clear()
+            self._orders.clear()
+            self._dirty = False
+
+    def _sorted_indices(self, sort_order):
+        """Assignment indices ordered by score, computed once per sort order."""
+        order = self._orders.get(sort_order)
+        if order is None:
+            scores = list(map(attrgetter('score'), self._assignments))
+            order = tuple(sorted(range(len(scores)), key=scores.__getitem__, reverse=(sort_order == "descending")))
+            self._orders[sort_order] = order
+        return order
+
+    def summarize(self, sort_order="ascending"):
+        """Collect group totals, resubmissions and report rows with one walk over the assignments."""
+        self._refresh_cache()
+        summary = self._summaries.get(sort_order)
+        if summary is None:
+            if self._summary is None:
+                self._summary = self._build_summary()
+            # Only the transcript order depends on sort_order; reuse the prebuilt rows
+            transcript_cells = self._summary.transcript_rows
+            summary = self._summary._replace(
+                transcript_rows=tuple(transcript_cells[i] for i in self._sorted_indices(sort_order)))
+            self._summaries[sort_order] = summary
+        return summary
+
+    def _build_summary(self):
+        """Order-independent CourseSummary, with transcript rows in insertion order."""
+        formative_weight = formative_score = 0
+        summative_weight = summative_score = 0
+        total_weight = total_weighted_score = 0
+        resubmissions = []
+        count = len(self._assignments)
+        transcript_cells = [None] * count
+        detail_rows = [None] * count
+
+        for i, assignment in enumerate(self._assignments):
+            # Read each attribute once; the rest of the loop works on locals
+            name = assignment.name
+            score = assignment.score
+            weight = assignment.weight
+            assignment_type = assignment.assignment_type
+            weighted_score = assignment.get_weighted_score()
+
+            total_weight += weight
+            total_weighted_score += weighted_score
+            if assignment_type == 'Formative':
+                formative_weight += weight
+                formative_score += weighted_score
+                if score < 50:
+                    resubmissions.append(name)
+            elif assignment_type == 'Summative':
+                summative_weight += weight
+                summative_score += weighted_score
+            # Format each cell once and share it between the transcript and the detail table
+            score_str = f"{score}%"
+            weight_str = f"{weight}%"
+            transcript_cells[i] = (name, assignment_type, score_str, weight_str)
+            detail_rows[i] = (name, score_str, weight_str, f"{weighted_score:.2f}%")
+
+        # Tuples so callers cannot mutate the cached rows
+        return CourseSummary(formative_weight, formative_score, summative_weight, summative_score,
+                             total_weight, total_weighted_score, tuple(resubmissions),
+                             tuple(transcript_cells), tuple(detail_rows))
+
+    def check_progression(self, summary=None):
+        if summary is None:
+            summary = self.summarize()
+        formative_weight, formative_score = summary.formative_weight, summary.formative_score
+        summative_weight, summative_score = summary.summative_weight, summary.summative_score
 
         formative_total = formative_score / formative_weight * 100 if formative_weight else 0
         summative_total = summative_score / summative_weight * 100 if summative_weight else 0
@@ -58,15 +266,140 @@ class Course:
         return passed, formative_total, summative_total
 
     def get_resubmission_candidates(self):
-        return [assignment.name for assignment in self.assignments if assignment.score < 50 and assignment.assignment_type == 'Formative']
+        return [assignment.name for assignment in self._assignments if assignment.score < 50 and assignment.assignment_type == 'Formative']
 
     def generate_transcript(self, sort_order="ascending"):
-        # Sort the assignments by score in the desired order
-        sorted_assignments = sorted(self.assignments, key=lambda x: x.score, reverse=(sort_order == "descending"))
-        return sorted_assignments
+        # Sort the assignments by score in the desired order; the caller gets a fresh list
+        self._refresh_cache()
+        assignments = self._assignments
+        return [assignments[i] for i in self._sorted_indices(sort_order)]
+
+
+def _is_transient(error):
+    """Whether a failed send is worth retrying on a fresh connection."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code in _TRANSIENT_SMTP_CODES
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # Other SMTP errors are permanent; bare OSErrors are network failures (refused, timeout, DNS)
+    return not isinstance(error, smtplib.SMTPException)
+
+
+class SMTPSession:
+    """A logged-in SMTP connection that can be reused for several messages."""
+
+    def __init__(self, sender_email, app_password, host='smtp.gmail.com', port=587):
+        self.sender_email = sender_email
+        self.app_password = app_password
+        self.host = host
+        self.port = port
+        self.server = None
+
+    def __enter__(self):
+        server = smtplib.SMTP(self.host, self.port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.app_password)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            # QUIT failed or the connection is already broken; drop the socket without the handshake
+            self.server.close()
+        finally:
+            self.server = None
+
+    def reconnect(self):
+        """Replace a dropped or rejected connection with a freshly logged-in one."""
+        self.close()
+        self.__enter__()
+
+    def send(self, msg):
+        if self.server is None:
+            raise smtplib.SMTPServerDisconnected("SMTP session is not connected")
+        self.server.send_message(msg)
+
+
+class SMTPPool:
+    """A fixed number of logged-in SMTPSessions shared between worker threads."""
+
+    def __init__(self, sender_email, app_password, size=5, host='smtp.gmail.com', port=587):
+        self.sender_email = sender_email
+        self.app_password = app_password
+        self.size = min(size, MAX_SMTP_CONNECTIONS)
+        self.host = host
+        self.port = port
+        self._sessions = []
+        self._idle = queue.Queue()
+        self._closed = True  # Only open between __enter__ and close()
+
+    def __enter__(self):
+        self._closed = False
+        try:
+            for _ in range(self.size):
+                session = SMTPSession(self.sender_email, self.app_password, self.host, self.port)
+                self._sessions.append(session.__enter__())
+                self._idle.put(session)
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._closed = True
+        for session in self._sessions:
+            session.close()
+        self._sessions = []
+        self._idle = queue.Queue()
+
+    def _acquire(self):
+        """Take an idle session, failing instead of waiting forever once the pool is closed."""
+        while True:
+            if self._closed:
+                raise smtplib.SMTPServerDisconnected("SMTP pool is closed")
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                pass
+
+    def send(self, msg, retries=3):
+        """Send msg on the next idle connection, backing off and reconnecting on transient errors."""
+        session = self._acquire()
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    if session.server is None:
+                        session.reconnect()
+                    session.send(msg)
+                    return
+                except OSError as e:  # smtplib's exceptions are OSErrors too
+                    if not _is_transient(e) or attempt == retries:
+                        raise
+                    # Drop the connection; the next attempt reconnects after the backoff,
+                    # and a failed reconnect is retried like any other transient error
+                    session.close()
+                    time.sleep(2 ** attempt)
+        finally:
+            self._idle.put(session)
 
 
 class Student:
+    __slots__ = ('name', 'email', 'courses')
+
     def __init__(self, name, email):
         self.name = name
         self.email = email
@@ -76,140 +409,178 @@ class Student:
         self.courses.append(course)
 
     def calculate_gpa(self):
-        total_weighted_score = 0
-        total_weight = 0
-
+        total_weight = total_weighted_score = 0
         for course in self.courses:
-            for assignment in course.assignments:
-                total_weighted_score += assignment.get_weighted_score()
-                total_weight += assignment.weight
+            course_weight, course_weighted_score = course.calculate_totals()
+            total_weight += course_weight
+            total_weighted_score += course_weighted_score
 
         return (total_weighted_score / total_weight) * 100 if total_weight else 0
 
     def generate_report(self, sort_order="ascending"):
-        report = f"Report for {self.name} ({self.email})\n"
-        report += "=" * 40 + "\n"
+        return "".join(self._iter_report(sort_order))
 
-        # Track overall data for GPA
-        overall_score = 0
-        total_weight = 0
+    def _iter_report(self, sort_order="ascending"):
+        """Yield the report text fragment by fragment."""
+        yield "Report for "
+        yield self.name
+        yield " ("
+        yield self.email
+        yield ")\n"
+        yield _EQ
 
+        # Track overall data for GPA
         table_data = []
-        total_courses = len(self.courses)
         total_weighted_score_all_courses = 0
         total_weight_all_courses = 0
 
         for course in self.courses:
             # Check course progression (pass/fail)
-            passed, formative_total, summative_total = course.check_progression()
-            resubmissions = course.get_resubmission_candidates()
+            summary = course.summarize(sort_order)
+            passed, formative_total, summative_total = course.check_progression(summary)
+            resubmissions = summary.resubmissions
             attendance_percentage = course.calculate_attendance()
 
             # Collecting course summary
-            report += f"\nCourse: {course.name}\n"
-            report += f"Formative Group Total: {formative_total:.2f}%\n"
-            report += f"Summative Group Total: {summative_total:.2f}%\n"
-            report += "Passed: " + ("Yes" if passed else "No") + "\n"
+            yield "\nCourse: "
+            yield course.name
+            yield "\n"
+            yield f"Formative Group Total: {formative_total:.2f}%\n"
+            yield f"Summative Group Total: {summative_total:.2f}%\n"
+            yield _PASS_YES if passed else _PASS_NO
 
             # Handle resubmission eligibility
             if resubmissions:
-                report += f"Eligible for Resubmission: {', '.join(resubmissions)}\n"
+                yield "Eligible for Resubmission: "
+                yield ", ".join(resubmissions)
+                yield "\n"
             else:
-                report += "No Resubmissions Needed.\n"
+                yield _NO_RESUBMISSIONS
 
             # Attendance report
-            report += f"Attendance: {attendance_percentage:.2f}%\n"
+            yield f"Attendance: {attendance_percentage:.2f}%\n"
             if attendance_percentage == 100:
-                report += "Attendance is in good standing (100%).\n"
+                yield _ATT_OK
             else:
-                report += "Warning: Attendance is below 100%. The student should attend more classes.\n"
+                yield _ATT_WARN
 
             # Generate transcript for the course
-            report += "\nTranscript Breakdown:\n"
-            report += tabulate([[assignment.name, assignment.assignment_type, f"{assignment.score}%", f"{assignment.weight}%"] for assignment in course.generate_transcript(sort_order)], 
-                               headers=["Assignment", "Type", "Score (%)", "Weight (%)"], tablefmt="grid")
-            report += "\n" + "-" * 60 + "\n"
+            yield _TRANSCRIPT_TITLE
+            yield from _iter_grid(_TRANSCRIPT_HEADERS, summary.transcript_rows)
+            yield "\n"
+            yield _DASH
 
             # Collecting data for overall GPA calculation
-            for assignment in course.assignments:
-                table_data.append([course.name, assignment.name, f"{assignment.score}%", f"{assignment.weight}%", f"{assignment.get_weighted_score():.2f}%"])
-                total_weighted_score_all_courses += assignment.get_weighted_score()
-                total_weight_all_courses += assignment.weight
+            course_row = (course.name,)
+            table_data.extend(course_row + row for row in summary.detail_rows)
+            total_weighted_score_all_courses += summary.total_weighted_score
+            total_weight_all_courses += summary.total_weight
 
         # Overall GPA and Average Score
         gpa = self.calculate_gpa()
         overall_avg_score = (total_weighted_score_all_courses / total_weight_all_courses) * 100 if total_weight_all_courses else 0
-        report += f"\nOverall GPA: {gpa:.2f}%\n"
-        report += f"Overall Average Score: {overall_avg_score:.2f}%\n"
-        report += "=" * 40 + "\n"
+        yield f"\nOverall GPA: {gpa:.2f}%\n"
+        yield f"Overall Average Score: {overall_avg_score:.2f}%\n"
+        yield _EQ
 
         # Generate final report table
-        report += "\nDetailed Report:\n"
-        report += tabulate(table_data, headers=["Course", "Assignment", "Score", "Weight", "Weighted Score"], tablefmt="grid")
-        
-        return report
-
-    def send_report_to_parent(self, parent_email, sender_email, app_password, sort_order="ascending"):
-        report = self.generate_report(sort_order)
+        yield _DETAIL_TITLE
+        yield from _iter_grid(_DETAIL_HEADERS, table_data)
 
-        # Send email logic (same as your current code, using SMTP)
-        msg = MIMEMultipart()
+    def build_report_message(self, parent_email, sender_email, sort_order="ascending"):
+        msg = EmailMessage()
         msg['From'] = sender_email
         msg['To'] = parent_email
         msg['Subject'] = f"Student Report for {self.name}"
+        msg.set_content("".join(self._iter_report(sort_order)))
+        return msg
 
-        msg.attach(MIMEText(report, 'plain'))
+    def send_report_to_parent(self, parent_email, session, sort_order="ascending"):
+        """Email the report over an open SMTPSession or SMTPPool, which owns the credentials."""
+        msg = self.build_report_message(parent_email, session.sender_email, sort_order)
 
         try:
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls()
-            server.login(sender_email, app_password)
-            server.sendmail(sender_email, parent_email, msg.as_string())
-            server.quit()
+            session.send(msg)
             print(f"Report sent to {parent_email}")
         except Exception as e:
             print(f"Failed to send email: {str(e)}")
 
 
-# Example usage
-student = Student("ISHIMWE Bruno", "i.bruno@alustudent.com")
-
-# Creating courses with Formative and Summative assignments
-course_1 = Course("Introduction to Programming and Databases", total_sessions=7)
-course_1.add_assignment(Assignment("Python - Hello, World", 100, 10, 'Formative'))
-course_1.add_assignment(Assignment("Python - Inheritance", 40.59, 20, 'Formative'))
-course_1.add_assignment(Assignment("Python - Data Structures", 100, 30, 'Summative'))
-course_1.mark_attendance("Sep 16", "Present")
-course_1.mark_attendance("Sep 17", "Present")
-course_1.mark_attendance("Sep 18", "Present")
-course_1.mark_attendance("Sep 19", "Present")
-course_1.mark_attendance("Sep 20", "Present")
-course_1.mark_attendance("Sep 21", "Present")
-course_1.mark_attendance("Sep 22", "Present")  # Corrected attendance to 100% for all sessions
-
-course_2 = Course("Self-Leadership and Team Dynamics", total_sessions=7)
-course_2.add_assignment(Assignment("Enneagram Test", 80, 10, 'Formative'))
-course_2.add_assignment(Assignment("Empathy Discussion Board", 65, 20, 'Formative'))
-course_2.add_assignment(Assignment("Community Building Quiz", 90, 20, 'Summative'))
-
-course_3 = Course("Introduction to IT Tools and Linux", total_sessions=10)  # Added new course
-course_3.add_assignment(Assignment("Pre-reading Sunday 1", 90, 10, 'Formative'))
-course_3.add_assignment(Assignment("Discussion Board", 100, 20, 'Formative'))
-course_3.add_assignment(Assignment("In Call Check-in Quiz 1", 65, 15, 'Formative'))
-course_3.add_assignment(Assignment("Pre-reading Sunday 2", 83.33, 15, 'Formative'))
-course_3.add_assignment(Assignment("General Quiz", 75.51, 15, 'Formative'))
-course_3.add_assignment(Assignment("Shell, processes and signals", 100, 25, 'Summative'))
-
-# Adding courses to student
-student.add_course(course_1)
-student.add_course(course_2)
-student.add_course(course_3)
-
-# Print report to terminal
-print(student.generate_report(sort_order="ascending"))
-
-# Optional: Send report to parent's email
-parent_email = "ishimwebruno331@gmail.com"
-sender_email = "i.bruno@alustudent.com"
-app_password = "PRE EDUCA STD PLL"
-student.send_report_to_parent(parent_email, sender_email, app_password)
+def send_bulk(messages, pool):
+    """Send messages concurrently, one worker thread per connection in an open SMTPPool."""
+    def send(msg):
+        try:
+            pool.send(msg)
+            print(f"Report sent to {msg['To']}")
+        except Exception as e:
+            print(f"Failed to send email to {msg['To']}: {str(e)}")
+
+    # Leaving the executor block waits for every send to finish
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        executor.map(send, messages)
+
+
+def send_reports_to_parents(recipients, pool, sort_order="ascending"):
+    """Send each (student, parent_email) report over an open SMTPPool."""
+    messages = [student.build_report_message(parent_email, pool.sender_email, sort_order)
+                for student, parent_email in recipients]
+    send_bulk(messages, pool)
+
+
+def build_example_student():
+    # Example usage: (name, total sessions, assignments, attended dates)
+    courses = [
+        ("Introduction to Programming and Databases", 7, [
+            ("Python - Hello, World", 100, 10, 'Formative'),
+            ("Python - Inheritance", 40.59, 20, 'Formative'),
+            ("Python - Data Structures", 100, 30, 'Summative'),
+        ], ["Sep 16", "Sep 17", "Sep 18", "Sep 19", "Sep 20", "Sep 21", "Sep 22"]),
+        ("Self-Leadership and Team Dynamics", 7, [
+            ("Enneagram Test", 80, 10, 'Formative'),
+            ("Empathy Discussion Board", 65, 20, 'Formative'),
+            ("Community Building Quiz", 90, 20, 'Summative'),
+        ], []),
+        ("Introduction to IT Tools and Linux", 10, [
+            ("Pre-reading Sunday 1", 90, 10, 'Formative'),
+            ("Discussion Board", 100, 20, 'Formative'),
+            ("In Call Check-in Quiz 1", 65, 15, 'Formative'),
+            ("Pre-reading Sunday 2", 83.33, 15, 'Formative'),
+            ("General Quiz", 75.51, 15, 'Formative'),
+            ("Shell, processes and signals", 100, 25, 'Summative'),
+        ], []),
+    ]
+
+    student = Student("ISHIMWE Bruno", "i.bruno@alustudent.com")
+    for course_name, total_sessions, assignments, attended in courses:
+        course = Course(course_name, total_sessions)
+        for assignment in assignments:
+            course.add_assignment(Assignment(*assignment))
+        for date in attended:
+            course.mark_attendance(date, "Present")
+        student.add_course(course)
+    return student
+
+
+def main():
+    student = build_example_student()
+
+    # Print report to terminal
+    print(student.generate_report(sort_order="ascending"))
+
+    # Optional: Send report to parent's email, with SMTP credentials taken from the environment
+    parent_email = "ishimwebruno331@gmail.com"
+    sender_email = os.environ.get('ALU_SMTP_USER')
+    app_password = os.environ.get('ALU_SMTP_PW')
+    if not (sender_email and app_password):
+        print("Set ALU_SMTP_USER and ALU_SMTP_PW to email the report.")
+        return
+
+    try:
+        with SMTPSession(sender_email, app_password) as session:
+            student.send_report_to_parent(parent_email, session)
+    except Exception as e:
+        print(f"Failed to send email: {str(e)}")
+
+
+if __name__ == '__main__':
+    main()
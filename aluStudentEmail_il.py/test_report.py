@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+import importlib.util
+import os
+import smtplib
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# The script's file name is not a valid module name, so load it by path
+_spec = importlib.util.spec_from_file_location("report", os.path.join(HERE, "i.bruno@alustudent.com_il.py"))
+report = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(report)
+
+
+def read_expected(name):
+    with open(os.path.join(HERE, name)) as f:
+        return f.read()
+
+
+class ExampleReportTest(unittest.TestCase):
+    """The example report must stay byte-for-byte identical to the original tabulate output."""
+
+    def test_ascending_report(self):
+        student = report.build_example_student()
+        self.assertEqual(student.generate_report("ascending"), read_expected("expected_report.txt"))
+
+    def test_descending_report(self):
+        student = report.build_example_student()
+        self.assertEqual(student.generate_report("descending"), read_expected("expected_report_descending.txt"))
+
+    def test_repeated_reports_are_identical(self):
+        student = report.build_example_student()
+        first = student.generate_report("ascending")
+        student.generate_report("descending")
+        self.assertEqual(student.generate_report("ascending"), first)
+
+    def test_renamed_course_shows_new_name_everywhere(self):
+        student = report.build_example_student()
+        student.generate_report()
+        course = student.courses[0]
+        old_name = course.name
+        course.name = "RENAMED"
+        text = student.generate_report()
+        self.assertNotIn(old_name, text)
+        self.assertIn("Course: RENAMED", text)
+        self.assertIn("| RENAMED ", text.split("Detailed Report:")[1])
+
+    def test_assignment_added_after_report_is_included(self):
+        student = report.build_example_student()
+        student.generate_report("ascending")
+        student.generate_report("descending")
+        course = student.courses[1]
+        course.add_assignment(report.Assignment("Late Quiz", 20, 10, 'Formative'))
+        for sort_order in ("ascending", "descending"):
+            text = student.generate_report(sort_order)
+            self.assertIn("Eligible for Resubmission: Late Quiz", text)
+            self.assertIn("| Late Quiz ", text.split("Detailed Report:")[1])
+        self.assertEqual(course.generate_transcript()[0].name, "Late Quiz")
+        self.assertEqual(course.generate_transcript("descending")[-1].name, "Late Quiz")
+
+
+class GridTest(unittest.TestCase):
+    def grid(self, headers, rows):
+        return "".join(report._iter_grid(headers, rows))
+
+    def test_empty_table(self):
+        self.assertEqual(self.grid(["A", "Type"], []),
+                         "+-----+--------+\n"
+                         "| A   | Type   |\n"
+                         "+=====+========+\n"
+                         "+-----+--------+")
+
+    def test_cells_are_stripped(self):
+        self.assertEqual(self.grid(["A"], [(" lead ",)]),
+                         "+------+\n"
+                         "| A    |\n"
+                         "+======+\n"
+                         "| lead |\n"
+                         "+------+")
+
+    def test_multiline_cells(self):
+        self.assertEqual(self.grid(["A", "B"], [("one\ntwo", "x")]),
+                         "+-----+-----+\n"
+                         "| A   | B   |\n"
+                         "+=====+=====+\n"
+                         "| one | x   |\n"
+                         "| two |     |\n"
+                         "+-----+-----+")
+
+    def test_numeric_looking_cells_stay_left_aligned_text(self):
+        # Deliberate deviation from tabulate, which right-aligns and reformats numbers ("1e3" -> 1000)
+        self.assertEqual(self.grid(["A"], [("123",), ("-7",), ("nan",), ("1e3",)]),
+                         "+-----+\n"
+                         "| A   |\n"
+                         "+=====+\n"
+                         "| 123 |\n"
+                         "+-----+\n"
+                         "| -7  |\n"
+                         "+-----+\n"
+                         "| nan |\n"
+                         "+-----+\n"
+                         "| 1e3 |\n"
+                         "+-----+")
+
+    @unittest.skipIf(report.wcswidth is None, "wcwidth is not installed")
+    def test_wide_characters_keep_borders_aligned(self):
+        self.assertEqual(self.grid(["Assignment", "T"], [("日本語", "x"), ("ab", "y")]),
+                         "+--------------+-----+\n"
+                         "| Assignment   | T   |\n"
+                         "+==============+=====+\n"
+                         "| 日本語       | x   |\n"
+                         "+--------------+-----+\n"
+                         "| ab           | y   |\n"
+                         "+--------------+-----+")
+
+
+class FakeSMTP:
+    fail_login = False
+    quit_error = None
+    connect_errors = []  # Raised by successive connection attempts, then connect normally
+    send_errors = []  # Raised by successive sends, then send normally
+    instances = []
+
+    def __init__(self, host, port):
+        if FakeSMTP.connect_errors:
+            raise FakeSMTP.connect_errors.pop(0)
+        self.sent = []
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        if FakeSMTP.fail_login:
+            raise smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    def send_message(self, msg):
+        if FakeSMTP.send_errors:
+            raise FakeSMTP.send_errors.pop(0)
+        self.sent.append(msg)
+
+    def quit(self):
+        if FakeSMTP.quit_error is not None:
+            raise FakeSMTP.quit_error
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@mock.patch.object(report.time, "sleep")
+@mock.patch.object(report.smtplib, "SMTP", FakeSMTP)
+class SMTPTest(unittest.TestCase):
+    def tearDown(self):
+        FakeSMTP.fail_login = False
+        FakeSMTP.quit_error = None
+        FakeSMTP.connect_errors = []
+        FakeSMTP.send_errors = []
+        FakeSMTP.instances = []
+
+    def test_transient_error_is_retried_on_a_new_connection(self, sleep):
+        with report.SMTPPool("sender@example.com", "pw", size=1) as pool:
+            FakeSMTP.send_errors = [smtplib.SMTPResponseException(421, b"try again")]
+            pool.send("message")
+            self.assertEqual(pool._sessions[0].server.sent, ["message"])
+        self.assertEqual(len(FakeSMTP.instances), 2)
+        sleep.assert_called_once_with(1)
+
+    def test_refused_reconnect_is_retried(self, sleep):
+        with report.SMTPPool("sender@example.com", "pw", size=1) as pool:
+            FakeSMTP.send_errors = [smtplib.SMTPResponseException(421, b"try again")]
+            FakeSMTP.connect_errors = [ConnectionRefusedError("refused")]
+            pool.send("message")
+            self.assertEqual(pool._sessions[0].server.sent, ["message"])
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_permanent_error_is_raised_immediately(self, sleep):
+        with report.SMTPPool("sender@example.com", "pw", size=1) as pool:
+            FakeSMTP.send_errors = [smtplib.SMTPResponseException(550, b"no such user")]
+            with self.assertRaises(smtplib.SMTPResponseException):
+                pool.send("message")
+        self.assertEqual(len(FakeSMTP.instances), 1)
+        sleep.assert_not_called()
+
+    def test_retries_give_up_after_the_limit(self, sleep):
+        with report.SMTPPool("sender@example.com", "pw", size=1) as pool:
+            FakeSMTP.send_errors = [smtplib.SMTPResponseException(421, b"try again")] * 4
+            with self.assertRaises(smtplib.SMTPResponseException):
+                pool.send("message", retries=3)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1, 2, 4])
+
+    def test_failed_reconnect_surfaces_login_error(self, sleep):
+        with self.assertRaises(smtplib.SMTPAuthenticationError):
+            with report.SMTPSession("sender@example.com", "pw") as session:
+                FakeSMTP.fail_login = True
+                session.reconnect()
+
+    def test_failed_quit_still_closes_every_connection(self, sleep):
+        for error in (smtplib.SMTPResponseException(500, b"error"), OSError("connection reset")):
+            FakeSMTP.instances = []
+            pool = report.SMTPPool("sender@example.com", "pw", size=3)
+            with self.assertRaises(KeyError):
+                with pool:
+                    FakeSMTP.quit_error = error
+                    raise KeyError("original")  # Must not be masked by the failing QUIT
+            FakeSMTP.quit_error = None
+            self.assertEqual(len(FakeSMTP.instances), 3)
+            self.assertTrue(all(server.closed for server in FakeSMTP.instances))
+            self.assertEqual(pool._sessions, [])
+
+    def test_closed_pool_refuses_to_send(self, sleep):
+        pool = report.SMTPPool("sender@example.com", "pw", size=2)
+        with pool:
+            pass
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            pool.send(None)
+
+    def test_pool_sends_every_report(self, sleep):
+        student = report.build_example_student()
+        with report.SMTPPool("sender@example.com", "pw", size=2) as pool:
+            sessions = list(pool._sessions)
+            with mock.patch("builtins.print"):
+                report.send_reports_to_parents([(student, "a@example.com"), (student, "b@example.com")], pool)
+            recipients = sorted(msg['To'] for session in sessions for msg in session.server.sent)
+        self.assertEqual(recipients, ["a@example.com", "b@example.com"])
+
+
+if __name__ == '__main__':
+    unittest.main()